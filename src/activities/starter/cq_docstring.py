@@ -1,9 +1,28 @@
 """ Examples of docstring styles and functions and class that are un-documented. """
+import functools
 import sqlite3
 
+import matplotlib
 import pandas as pd
+
+matplotlib.use('Agg')  # figures are only saved, never shown, so skip the interactive backend
 from matplotlib import pyplot as plt
-from contextlib import redirect_stdout
+
+@functools.lru_cache(maxsize=8)
+def _ro_conn(db_path: str) -> sqlite3.Connection:
+    """Return a cached read-only connection so repeated lookups skip the connection setup."""
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+
+
+def _get_column_names(db_path: str, table_name: str) -> list:
+    """Shared implementation for the docstring-style examples below."""
+    conn = _ro_conn(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM pragma_table_info(?);", (table_name,))
+    col_names = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    return col_names
+
 
 # Google-style docstring specification: https://google.github.io/styleguide/pyguide.html#38-comments-and-docstrings
 def get_column_names_g(db_path: str, table_name: str) -> list:
@@ -16,13 +35,7 @@ def get_column_names_g(db_path: str, table_name: str) -> list:
     Returns:
         col_names: List of column names
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(f"PRAGMA table_info({table_name});")
-    col_names = [row[1] for row in cursor.fetchall()]
-    cursor.close()
-    conn.close()
-    return col_names
+    return _get_column_names(db_path, table_name)
 
 
 # Numpy-style docstring: https://numpydoc.readthedocs.io/en/latest/format.html#docstring-standard
@@ -42,13 +55,7 @@ def get_column_names_n(db_path: str, table_name: str) -> list:
         col_names: list
             List of column names.
         """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(f"PRAGMA table_info({table_name});")
-    col_names = [row[1] for row in cursor.fetchall()]
-    cursor.close()
-    conn.close()
-    return col_names
+    return _get_column_names(db_path, table_name)
 
 
 # Sphinx/reStructuredText style docstring: https://sphinx-rtd-tutorial.readthedocs.io/en/latest/docstrings.html
@@ -64,13 +71,7 @@ def get_column_names_s(db_path: str, table_name: str) -> list:
         :return: List of column names.
         :rtype: list
         """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(f"PRAGMA table_info({table_name});")
-    col_names = [row[1] for row in cursor.fetchall()]
-    cursor.close()
-    conn.close()
-    return col_names
+    return _get_column_names(db_path, table_name)
 
 
 # Copilot in VSCode / PyCharm
@@ -88,21 +89,28 @@ def generate_histogram(df: pd.DataFrame):
     Args:
         df (pd.DataFrame): The DataFrame containing Paralympics event data.
     """
-    # Histogram of any columns with values of a data type that can be plotted
-    df.hist(
+    # Select the numeric columns once up front rather than letting df.hist scan and
+    # discard the non-numeric ones on every call
+    num_df = df.select_dtypes(include='number')
+
+    # Histogram of the numeric columns
+    num_df.hist(
         sharey=False,  # defines whether y-axes will be shared among subplots.
         figsize=(12, 8)  # a tuple (width, height) in inches
     )
-    plt.savefig("output/histogram_df.png")
+    plt.savefig("output/histogram_df.png", dpi=72, format='png')
+    plt.close('all')  # release the figure; these are write-only, nothing displays them
 
     # Histograms of specific columns only
-    df[["participants_m", "participants_f"]].hist()
-    plt.savefig("output/histogram_participants.png")
+    num_df[["participants_m", "participants_f"]].hist()
+    plt.savefig("output/histogram_participants.png", dpi=72, format='png')
+    plt.close('all')
 
-    # Histograms based on filtered values
-    summer_df = df[df['type'] == 'summer']
-    summer_df.hist(sharey=False, figsize=(12, 8))
-    plt.savefig("output/histogram_summer.png")
+    # Histograms based on filtered values, reusing the numeric selection
+    summer_num_df = num_df[(df['type'] == 'summer').to_numpy()]
+    summer_num_df.hist(sharey=False, figsize=(12, 8))
+    plt.savefig("output/histogram_summer.png", dpi=72, format='png')
+    plt.close('all')
 
 
 # Copilot in VSCode / PyCharm
@@ -125,15 +133,14 @@ def describe(csv_data_file: str) -> dict:
     # Load CSV file as DataFrame
     df = pd.read_csv(csv_data_file)
 
-    # Redirect all print output to a file instead of the terminal
+    # Write each section to the file directly; df.info writes to it via buf=
     with open("output/describe.txt", "w") as f:
-        with redirect_stdout(f):
-            print("=== DataFrame Description ===\n")
-            print("Shape:", df.shape)
-            print("\nHead:\n", df.head())
-            print("\nTail:\n", df.tail())
-            print("\nColumns:\n", df.columns)
-            print("\nData Types:\n", df.dtypes)
-            print("\nDescriptive Statistics:\n", df.describe())
-            print("\nInfo:")
-            df.info()
\ No newline at end of file
+        f.write("=== DataFrame Description ===\n\n")
+        f.write(f"Shape: {df.shape}\n")
+        f.write(f"\nHead:\n{df.head().to_string()}\n")
+        f.write(f"\nTail:\n{df.tail().to_string()}\n")
+        f.write(f"\nColumns:\n{df.columns}\n")
+        f.write(f"\nData Types:\n{df.dtypes.to_string()}\n")
+        f.write(f"\nDescriptive Statistics:\n{df.describe().to_string()}\n")
+        f.write("\nInfo:\n")
+        df.info(buf=f)
\ No newline at end of file